@@ -1,28 +1,259 @@
+import ctypes
+import json
+import logging
 import os
 import subprocess
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from .core import DaVinciResolveScript as bmd
 
+logger = logging.getLogger(__name__)
+
+# Pages accepted by open_page.
+_PAGE_NAMES = ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver")
+_VALID_PAGES = frozenset(_PAGE_NAMES)
+
+# Time (in seconds) get_current_page reuses the last answer.
+_PAGE_TTL = 0.25
+
+# Interval (in seconds) between readiness checks while waiting for Resolve to start.
+_STARTUP_POLL_INTERVAL = 0.2
+
+# Toolhelp32 snapshot flag, process entry and access right used to find and stop Resolve processes on Windows.
+_TH32CS_SNAPPROCESS = 0x00000002
+_PROCESS_TERMINATE = 0x0001
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_RESOLVE_EXE = 'resolve.exe'
+_kernel32 = None
+
+
+class _ProcessEntry32W(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', ctypes.c_ulong),
+        ('cntUsage', ctypes.c_ulong),
+        ('th32ProcessID', ctypes.c_ulong),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', ctypes.c_ulong),
+        ('cntThreads', ctypes.c_ulong),
+        ('th32ParentProcessID', ctypes.c_ulong),
+        ('pcPriClassBase', ctypes.c_long),
+        ('dwFlags', ctypes.c_ulong),
+        ('szExeFile', ctypes.c_wchar * 260),
+    ]
+
+# Script application handles returned by bmd.scriptapp, keyed by application name.
+_APP_CACHE = {}
+_APP_CACHE_LOCK = threading.Lock()
+
+# Time (in seconds) a "not found" answer from the project manager is reused before asking again.
+_NEGATIVE_TTL = 2.0
+
+# Time (in seconds) the project and folder names of the current folder are reused by list_current_folder.
+_LISTING_TTL = 1.0
+
+# Upper bound on the number of folder listings kept per MediaStorage cache.
+_CACHE_MAX_ENTRIES = 512
+
+# On-demand prefetch states of a folder; folders without an entry are ready.
+_PREFETCH_READY = 0
+_PREFETCH_IN_PROGRESS = 1
+
+# Location and maximum age (in seconds) of the Media Storage listing cache persisted between runs.
+_STORAGE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'blackmagic-design', 'storage.json')
+_STORAGE_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Time (in seconds) add_item_async waits to collect paths before adding them as one batch.
+_ADD_BATCH_WINDOW = 0.02
+
+# Executable paths recently found to exist; missing paths are never remembered so a later install is seen.
+_EXISTING_EXECUTABLES = set()
+_EXISTING_EXECUTABLES_MAX = 8
+
+
+def _get_kernel32():
+    """
+    Returns kernel32 with the signatures used here declared. Raises AttributeError outside Windows.
+    """
+    global _kernel32
+    if _kernel32 is None:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.c_ulong, ctypes.c_ulong]
+        kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+        kernel32.Process32FirstW.argtypes = [ctypes.c_void_p, ctypes.POINTER(_ProcessEntry32W)]
+        kernel32.Process32NextW.argtypes = [ctypes.c_void_p, ctypes.POINTER(_ProcessEntry32W)]
+        kernel32.OpenProcess.argtypes = [ctypes.c_ulong, ctypes.c_int, ctypes.c_ulong]
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        kernel32.TerminateProcess.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+        _kernel32 = kernel32
+    return _kernel32
+
+
+def _iter_resolve_pids():
+    """
+    Yields the process IDs of running Resolve.exe processes from a Toolhelp32 process snapshot.
+    Raises AttributeError or OSError when the Windows API is not available.
+    """
+    kernel32 = _get_kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        entry = _ProcessEntry32W()
+        entry.dwSize = ctypes.sizeof(_ProcessEntry32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == _RESOLVE_EXE:
+                yield entry.th32ProcessID
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+
+def _resolve_is_running() -> bool:
+    """
+    Returns True if a Resolve.exe process is running, falling back to tasklist without the Windows API.
+    """
+    try:
+        for _ in _iter_resolve_pids():
+            return True
+        return False
+    except (AttributeError, OSError):
+        result = subprocess.run(['tasklist', '/FO', 'CSV', '/NH'], capture_output=True)
+        return b'Resolve.exe' in result.stdout
+
+
+def _terminate_resolve_processes() -> int:
+    """
+    Terminates every running Resolve.exe process and returns how many were terminated.
+    """
+    kernel32 = _get_kernel32()
+    terminated = 0
+    for pid in list(_iter_resolve_pids()):
+        handle = kernel32.OpenProcess(_PROCESS_TERMINATE, False, pid)
+        if not handle:
+            continue
+        try:
+            if kernel32.TerminateProcess(handle, 1):
+                terminated += 1
+        finally:
+            kernel32.CloseHandle(handle)
+    return terminated
+
+
+def _scriptapp(app: str):
+    """
+    Returns the scripting handle for the application, attaching to it only on the first request.
+    Failed attaches are not cached so a later call can connect once the application is running.
+    """
+    with _APP_CACHE_LOCK:
+        handle = _APP_CACHE.get(app)
+        if handle is None:
+            handle = bmd.scriptapp(app)
+            if handle is not None:
+                _APP_CACHE[app] = handle
+        return handle
+
+
+def _copy_listing(listing):
+    """
+    Returns a copy of a cached listing so callers cannot modify the cache through the returned list.
+    """
+    return list(listing) if listing is not None else None
+
+
+def _folder_mtime(path: str) -> int | None:
+    """
+    Returns the modification time of the folder in nanoseconds, or None if it cannot be read.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
+def _is_under_volume(path: str, volumes: tuple) -> bool:
+    """
+    Returns True if the path is one of the volume root paths or lies inside one of them.
+    """
+    for volume in volumes:
+        if path == volume or (path.startswith(volume) and path[len(volume):len(volume) + 1] in ('/', '\\')):
+            return True
+    return False
+
+
+def _executable_exists(executable_path: str) -> bool:
+    """
+    Returns True if the executable exists, remembering paths that were found.
+    """
+    if executable_path in _EXISTING_EXECUTABLES:
+        return True
+    if not os.path.exists(executable_path):
+        return False
+    if len(_EXISTING_EXECUTABLES) >= _EXISTING_EXECUTABLES_MAX:
+        _EXISTING_EXECUTABLES.clear()
+    _EXISTING_EXECUTABLES.add(executable_path)
+    return True
+
+
+def _forget_scriptapp(app: str) -> None:
+    """
+    Drops the cached scripting handle for the application once its process has exited.
+    """
+    with _APP_CACHE_LOCK:
+        _APP_CACHE.pop(app, None)
+
 
 class Resolve:
-    def __init__(self, app: str = 'Resolve'):
+    __slots__ = (
+        'app', '_app_name', '_init_error', '_media_storage', '_project_manager', '_enable_prefetch',
+        '_prefetch_depth', '_persistent_cache', '_product_name', '_version', '_version_string', '_page_cache'
+    )
+
+    def __init__(
+            self, app: str = 'Resolve', enable_prefetch: bool = False, prefetch_depth: int = 1,
+            persistent_cache: bool = False
+    ):
         """
         Initializes the Resolve class, wrapping the DaVinci Resolve application.
 
         Args:
             app (str): The name of the DaVinci Resolve application to connect to. Defaults to 'Resolve'.
+            enable_prefetch (bool): Whether to warm the Media Storage listing cache for every mounted
+                                    volume when the media storage is first accessed and prefetch the
+                                    children of each newly listed folder in the background. Defaults to False.
+            prefetch_depth (int): How many folder levels below each mounted volume to prefetch
+                                  when enable_prefetch is set. Defaults to 1.
+            persistent_cache (bool): Whether to load the Media Storage listing cache saved by a previous
+                                     run and save it again on close(). Defaults to False.
+
+        If connecting to the application fails, app is left as None and the exception is
+        available through init_error.
         """
         self.app = None
-        self.media_storage = None
-        self.project_manager = None
+        self._app_name = app
+        self._init_error = None
+        self._media_storage = None
+        self._project_manager = None
+        self._enable_prefetch = enable_prefetch
+        self._prefetch_depth = prefetch_depth
+        self._persistent_cache = persistent_cache
+        self._product_name = None
+        self._version = None
+        self._version_string = None
+        self._page_cache = None
 
         try:
-            self.app = bmd.scriptapp(app)
-            if self.app:
-                self.media_storage = MediaStorage(self.app.GetMediaStorage())
-                self.project_manager = ProjectManager(self.app.GetProjectManager())
+            self.app = _scriptapp(app)
         except Exception as e:
-            print(f"Failed to initialize Resolve: {e}")
+            logger.warning("Failed to initialize Resolve: %s", e)
+            self._init_error = e
 
     def open(
             self, executable_path: str = 'C:/Program Files/Blackmagic Design/DaVinci Resolve/Resolve.exe',
@@ -33,36 +264,103 @@ class Resolve:
 
         Args:
             executable_path (str): The file path to the DaVinci Resolve executable. Defaults to the typical installation path.
-            wait_time (int): Time to wait (in seconds) after attempting to open DaVinci Resolve before checking if it's running. Defaults to 15 seconds.
+            wait_time (int): Maximum time to wait (in seconds) for DaVinci Resolve to start and accept scripting connections. Defaults to 15 seconds.
             gui (str): for now GUI use -nogui
 
         Returns:
             str: A message indicating whether Resolve was successfully opened, is already running, or if there was an error.
         """
-        if not os.path.exists(executable_path):
+        if not _executable_exists(executable_path):
             return f"Error: Resolve executable not found at '{executable_path}'. Please check the path and try again."
 
         try:
-            result = subprocess.run(['tasklist'], capture_output=True, text=True)
-            if 'Resolve.exe' in result.stdout:
+            if _resolve_is_running():
                 return "DaVinci Resolve is already running."
 
-            if gui == '-gui':
-                subprocess.Popen([executable_path])
-            elif gui == '-nogui':
-                subprocess.Popen(f'{executable_path} -nogui')
+            # Resolve is not running, so a cached handle belongs to an instance that was closed elsewhere.
+            _forget_scriptapp(self._app_name)
 
-            time.sleep(wait_time)
+            popen_kwargs = {}
+            if os.name == 'nt':
+                popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+            subprocess.Popen(
+                [executable_path] + (['-nogui'] if gui == '-nogui' else []),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True, **popen_kwargs
+            )
 
-            result = subprocess.run(['tasklist'], capture_output=True, text=True)
-            if 'Resolve.exe' in result.stdout:
+            if self._wait_for_start(time.monotonic() + wait_time):
                 return "DaVinci Resolve opened successfully."
-            else:
-                return "Error: Failed to detect Resolve in the task list. Please verify if the application has started."
+            return "Error: Failed to detect Resolve in the task list. Please verify if the application has started."
 
         except Exception as e:
             return f"Error: Failed to open DaVinci Resolve - {str(e)}"
 
+    def _wait_for_start(self, deadline: float) -> bool:
+        """
+        Polls until DaVinci Resolve is running and accepts a scripting connection, or the deadline passes.
+        Attaches to the application on success.
+        """
+        while time.monotonic() < deadline:
+            if _resolve_is_running():
+                app = _scriptapp(self._app_name)
+                if app:
+                    self._reset_app_state()
+                    self.app = app
+                    self._init_error = None
+                    return True
+            time.sleep(_STARTUP_POLL_INTERVAL)
+        return False
+
+    @staticmethod
+    def clear_app_cache() -> None:
+        """
+        Forgets every cached application handle so the next Resolve instance attaches again.
+        """
+        with _APP_CACHE_LOCK:
+            _APP_CACHE.clear()
+
+    def close(self) -> None:
+        """
+        Stops any background prefetching started by the media storage wrapper and, if
+        persistent_cache is enabled, saves its listing cache for the next run.
+        """
+        if self._media_storage is not None:
+            self._media_storage.close()
+            if self._persistent_cache:
+                try:
+                    self._media_storage.save_cache(_STORAGE_CACHE_PATH)
+                except OSError as e:
+                    logger.warning("Could not save the Media Storage cache to %s: %s", _STORAGE_CACHE_PATH, e)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def media_storage(self):
+        """
+        MediaStorage: The media storage interface, created on first access.
+        """
+        if self._media_storage is None and self.app:
+            media_storage = MediaStorage(self.app.GetMediaStorage(), async_prefetch=self._enable_prefetch)
+            if self._persistent_cache:
+                media_storage.load_cache(_STORAGE_CACHE_PATH, _STORAGE_CACHE_MAX_AGE)
+            self._media_storage = media_storage
+            if self._enable_prefetch:
+                self.prefetch_tree(depth=self._prefetch_depth)
+        return self._media_storage
+
+    @property
+    def project_manager(self):
+        """
+        ProjectManager: The project manager interface, created on first access.
+        """
+        if self._project_manager is None and self.app:
+            self._project_manager = ProjectManager(self.app.GetProjectManager())
+        return self._project_manager
+
     def get_media_storage(self):
         """
         Returns the MediaStorage object for interacting with DaVinci Resolve's media storage.
@@ -81,6 +379,41 @@ class Resolve:
         """
         return self.project_manager
 
+    def prefetch_tree(self, root: str = None, depth: int = 1, max_workers: int = 8) -> int:
+        """
+        Eagerly walks the Media Storage tree and populates the folder listing cache.
+
+        Args:
+            root (str, optional): The absolute folder path to start from. Defaults to None, which
+                                  prefetches every mounted volume.
+            depth (int, optional): How many folder levels below the root to descend. Defaults to 1.
+                                   None descends until the listing cache is full.
+            max_workers (int): Number of concurrent listing requests. Defaults to 8.
+
+        Returns:
+            int: The number of folders whose listings were fetched, 0 if DaVinci Resolve is not available.
+        """
+        media_storage = self.media_storage
+        if media_storage is None:
+            return 0
+        roots = [root] if root is not None else media_storage.get_mounted_volume_list() or []
+        return sum(media_storage.prefetch_tree(path, depth, max_workers) for path in roots)
+
+    def batch(self, ops: list, max_workers: int = 4) -> list:
+        """
+        Runs several API calls concurrently so their round-trips to DaVinci Resolve overlap.
+        DaVinci Resolve still executes the calls one at a time, so only the Python-side work runs in parallel.
+
+        Args:
+            ops (list): Callables taking no arguments, e.g. lambda: resolve.load_layout_preset('Edit').
+            max_workers (int): Number of calls in flight at the same time. Defaults to 4.
+
+        Returns:
+            list: The results of the callables, in the order they were given.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda op: op(), ops))
+
     def open_page(self, page_name: str) -> bool:
         """
         Switches to the indicated page in DaVinci Resolve.
@@ -92,21 +425,77 @@ class Resolve:
         Returns:
             bool: True if the page was successfully opened, False otherwise.
         """
-        valid_pages = ["media", "cut", "edit", "fusion", "color", "fairlight", "deliver"]
-        if page_name.lower() not in valid_pages:
-            raise ValueError(f"Invalid page name: {page_name}. Must be one of {valid_pages}.")
-        
-        return self.app.OpenPage(page_name.lower())
+        page = page_name if page_name in _VALID_PAGES else page_name.lower()
+        if page not in _VALID_PAGES:
+            raise ValueError(f"Invalid page name: {page_name}. Must be one of {list(_PAGE_NAMES)}.")
+
+        opened = self.app.OpenPage(page)
+        self._page_cache = (time.monotonic(), page) if opened else None
+        return opened
 
     def get_current_page(self) -> str:
         """
-        Returns the page currently displayed in the main window.
+        Returns the page currently displayed in the main window. The answer is reused for a quarter second.
 
         Returns:
             str: The name of the currently active page. It can be one of:
                  "media", "cut", "edit", "fusion", "color", "fairlight", "deliver", or None.
         """
-        return self.app.GetCurrentPage()
+        now = time.monotonic()
+        if self._page_cache is not None and now - self._page_cache[0] < _PAGE_TTL:
+            return self._page_cache[1]
+
+        page = self.app.GetCurrentPage()
+        self._page_cache = (now, page)
+        return page
+
+    @property
+    def init_error(self) -> Exception:
+        """
+        Exception: The error raised while connecting to DaVinci Resolve in __init__, or None if it succeeded.
+        """
+        return self._init_error
+
+    @property
+    def product_name(self) -> str:
+        """
+        str: The product name, queried once per running DaVinci Resolve process.
+        """
+        if self._product_name is None:
+            self._product_name = self.app.GetProductName()
+        return self._product_name
+
+    @property
+    def version(self) -> list:
+        """
+        list: The product version fields, queried once per running DaVinci Resolve process.
+        """
+        if self._version is None:
+            self._version = self.app.GetVersion()
+        return self._version
+
+    @property
+    def version_string(self) -> str:
+        """
+        str: The formatted product version, queried once per running DaVinci Resolve process.
+        """
+        if self._version_string is None:
+            self._version_string = self.app.GetVersionString()
+        return self._version_string
+
+    def _reset_app_state(self) -> None:
+        """
+        Drops everything tied to a DaVinci Resolve process after the application was started or stopped:
+        the cached product name, version and current page, and the media storage and project manager
+        wrappers around that process's scripting objects.
+        """
+        self._product_name = None
+        self._version = None
+        self._version_string = None
+        self._page_cache = None
+        self.close()
+        self._media_storage = None
+        self._project_manager = None
 
     def get_product_name(self) -> str:
         """
@@ -115,7 +504,7 @@ class Resolve:
         Returns:
             str: The product name.
         """
-        return self.app.GetProductName()
+        return self.product_name
 
     def get_version(self) -> list:
         """
@@ -124,7 +513,7 @@ class Resolve:
         Returns:
             list: A list of product version fields in [major, minor, patch, build, suffix] format.
         """
-        return self.app.GetVersion()
+        return self.version
 
     def get_version_string(self) -> str:
         """
@@ -133,7 +522,7 @@ class Resolve:
         Returns:
             str: The product version in "major.minor.patch[suffix].build" format.
         """
-        return self.app.GetVersionString()
+        return self.version_string
 
     def load_layout_preset(self, preset_name: str) -> bool:
         """
@@ -271,9 +660,9 @@ class Resolve:
         try:
             self.app.Quit()
 
-            result = subprocess.run(['tasklist'], capture_output=True, text=True)
-
-            if 'Resolve.exe' not in result.stdout:
+            if not _resolve_is_running():
+                _forget_scriptapp(self._app_name)
+                self._reset_app_state()
                 return 'DaVinci Resolve has been closed successfully.'
 
             return 'DaVinci Resolve did not close. Please use the kill function to terminate it manually.'
@@ -293,11 +682,9 @@ class Resolve:
             or if an error occurred.
         """
         try:
-            # Forcefully kill DaVinci Resolve process using taskkill
-            result = subprocess.run(['taskkill', '/IM', 'Resolve.exe', '/F'], capture_output=True, text=True)
-
-            # Check the result of the taskkill command
-            if 'SUCCESS' in result.stdout:
+            if _terminate_resolve_processes():
+                _forget_scriptapp(self._app_name)
+                self._reset_app_state()
                 return 'DaVinci Resolve has been forcefully terminated.'
             else:
                 return 'Failed to terminate DaVinci Resolve. Process may not be running.'
@@ -305,15 +692,320 @@ class Resolve:
         except Exception as e:
             return f'Failed to kill DaVinci Resolve: {e}'
 
+@dataclass(slots=True)
+class ItemInfo:
+    """
+    Describes a clip range to add to the Media Pool with add_item_list_to_media_pool.
+
+    Attributes:
+        media (str): The file path of the media.
+        start_frame (int): The first frame of the range.
+        end_frame (int): The last frame of the range.
+    """
+    media: str
+    start_frame: int
+    end_frame: int
+
 class MediaStorage:
-    def __init__(self, media_storage):
+    __slots__ = (
+        'media_storage', '_sub_cache', '_file_cache', '_ttl', '_lock', '_async_prefetch',
+        '_prefetch_state', '_inflight', '_executor', '_pending_adds', '_flush_timer',
+        '_GetSubFolderList', '_GetFileList', '_GetMountedVolumeList', '_RevealInStorage',
+        '_AddItemListToMediaPool', '_AddClipMattesToMediaPool', '_AddTimelineMattesToMediaPool'
+    )
+
+    def __init__(self, media_storage, cache_ttl: float = 10.0, async_prefetch: bool = False):
         """
         Initializes the MediaStorage class, wrapping the provided media storage object.
 
         Args:
             media_storage: The underlying MediaStorage object from DaVinci Resolve's API.
+            cache_ttl (float): Time (in seconds) folder listings are served from cache before
+                               being fetched again from DaVinci Resolve. Defaults to 10 seconds.
+            async_prefetch (bool): Whether a subfolder listing cache miss also fetches the listings
+                                   of the folder's children in the background. Defaults to False.
         """
         self.media_storage = media_storage
+        self._GetSubFolderList = media_storage.GetSubFolderList
+        self._GetFileList = media_storage.GetFileList
+        self._GetMountedVolumeList = media_storage.GetMountedVolumeList
+        self._RevealInStorage = media_storage.RevealInStorage
+        self._AddItemListToMediaPool = media_storage.AddItemListToMediaPool
+        self._AddClipMattesToMediaPool = media_storage.AddClipMattesToMediaPool
+        self._AddTimelineMattesToMediaPool = media_storage.AddTimelineMattesToMediaPool
+        self._sub_cache = OrderedDict()
+        self._file_cache = OrderedDict()
+        self._ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._async_prefetch = async_prefetch
+        self._prefetch_state = {}
+        self._inflight = {}
+        self._executor = None
+        self._pending_adds = []
+        self._flush_timer = None
+
+    def _cache_get(self, cache: OrderedDict, folder_path: str):
+        """
+        Returns the cached listing for the folder path, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = cache.get(folder_path)
+            if entry is None:
+                return None
+            timestamp, _, value = entry
+            if time.monotonic() - timestamp >= self._ttl:
+                del cache[folder_path]
+                return None
+            cache.move_to_end(folder_path)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, folder_path: str, value, mtime: int | None) -> None:
+        """
+        Stores a listing for the folder path together with the folder modification time read before
+        it was fetched, evicting the least recently used entry when full.
+        """
+        with self._lock:
+            cache[folder_path] = (time.monotonic(), mtime, value)
+            cache.move_to_end(folder_path)
+            if len(cache) > _CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+
+    def _fetch(self, cache: OrderedDict, fetch, folder_path: str):
+        """
+        Queries DaVinci Resolve for a folder listing and caches the result. When the same listing
+        is already being fetched by another thread, waits for that request instead of issuing a second one.
+        """
+        key = (id(cache), folder_path)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return future.result()
+
+        try:
+            # Read before fetching, so a change made during the request makes the saved listing stale.
+            mtime = _folder_mtime(folder_path)
+            value = fetch(folder_path)
+            self._cache_put(cache, folder_path, value, mtime)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return value
+
+    def _fetch_sub_folders(self, folder_path: str) -> list:
+        """
+        Queries DaVinci Resolve for the subfolders of the folder path and caches the result.
+        """
+        return self._fetch(self._sub_cache, self._GetSubFolderList, folder_path)
+
+    def _fetch_files(self, folder_path: str) -> list:
+        """
+        Queries DaVinci Resolve for the files in the folder path and caches the result.
+        """
+        return self._fetch(self._file_cache, self._GetFileList, folder_path)
+
+    def _get_listing(self, cache: OrderedDict, fetch, folder_path: str):
+        """
+        Returns the cached listing for the folder path, fetching it only when it is missing or expired.
+        """
+        value = self._cache_get(cache, folder_path)
+        if value is None:
+            value = fetch(folder_path)
+        return value
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor running background prefetches, creating it on first use.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='MediaStoragePrefetch')
+            return self._executor
+
+    def _schedule_prefetch(self, folder_path: str, sub_folders: list) -> None:
+        """
+        Submits a background prefetch of the folder's children unless one is already in progress.
+        """
+        with self._lock:
+            if self._prefetch_state.get(folder_path, _PREFETCH_READY) == _PREFETCH_IN_PROGRESS:
+                return
+            self._prefetch_state[folder_path] = _PREFETCH_IN_PROGRESS
+
+        try:
+            self._get_executor().submit(self._run_on_demand_prefetch, folder_path, sub_folders)
+        except RuntimeError:
+            # The executor was shut down by close().
+            with self._lock:
+                self._prefetch_state.pop(folder_path, None)
+
+    def _run_on_demand_prefetch(self, folder_path: str, sub_folders: list) -> None:
+        """
+        Fetches the file listing of the folder and the listings of its immediate children.
+        """
+        try:
+            self._get_listing(self._file_cache, self._fetch_files, folder_path)
+            for child in sub_folders or []:
+                self._get_listing(self._sub_cache, self._fetch_sub_folders, child)
+                self._get_listing(self._file_cache, self._fetch_files, child)
+        finally:
+            with self._lock:
+                self._prefetch_state.pop(folder_path, None)
+
+    def close(self) -> None:
+        """
+        Adds any queued items to the Media Pool, cancels pending background prefetches
+        and releases the worker threads.
+        """
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def invalidate(self, path: str = None) -> None:
+        """
+        Drops cached folder listings so the next lookup queries DaVinci Resolve again.
+
+        Args:
+            path (str, optional): The folder path to invalidate. Defaults to None, which clears every entry.
+        """
+        with self._lock:
+            if path is None:
+                self._sub_cache.clear()
+                self._file_cache.clear()
+            else:
+                self._sub_cache.pop(path, None)
+                self._file_cache.pop(path, None)
+
+    def save_cache(self, file_path: str) -> None:
+        """
+        Writes the cached folder listings, each with the wall-clock time it was fetched and the
+        folder modification time, to a JSON file, replacing it atomically.
+
+        Args:
+            file_path (str): The path of the cache file.
+
+        Raises:
+            OSError: If the cache file cannot be written.
+        """
+        wall_offset = time.time() - time.monotonic()
+        with self._lock:
+            sub_folders, files = (
+                {path: [timestamp + wall_offset, mtime, value] for path, (timestamp, mtime, value) in cache.items()}
+                for cache in (self._sub_cache, self._file_cache)
+            )
+
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'sub_folders': sub_folders, 'files': files}, f)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def load_cache(self, file_path: str, max_age: float = 24 * 60 * 60) -> int:
+        """
+        Loads folder listings saved by save_cache, skipping listings older than max_age, folders
+        on volumes that are no longer mounted and folders modified since their listing was fetched.
+        Loaded listings are treated as fetched now and expire after the configured TTL.
+
+        Args:
+            file_path (str): The path of the cache file.
+            max_age (float): Maximum age (in seconds) of a saved listing for it to be used. Defaults to one day.
+
+        Returns:
+            int: The number of folder listings loaded, 0 if the file is missing or unreadable.
+        """
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                data = json.load(f)
+            saved = ((self._sub_cache, data['sub_folders'].items()), (self._file_cache, data['files'].items()))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return 0
+
+        volumes = tuple(volume.rstrip('/\\') for volume in self.get_mounted_volume_list() or [])
+        now = time.time()
+        loaded = 0
+        for cache, listings in saved:
+            for path, entry in listings:
+                try:
+                    saved_at, mtime, value = entry
+                    saved_at = float(saved_at)
+                except (ValueError, TypeError):
+                    continue
+                if not (0 <= now - saved_at < max_age and _is_under_volume(path, volumes)):
+                    continue
+                if mtime is None or _folder_mtime(path) != mtime:
+                    continue
+                self._cache_put(cache, path, value, mtime)
+                loaded += 1
+        return loaded
+
+    def prefetch_tree(self, root: str, depth: int = 1, max_workers: int = 8) -> int:
+        """
+        Walks the folder tree below root level by level, fetching the listings of each level
+        concurrently and storing them in the cache. Folders that are already cached or being
+        fetched are not requested again. The walk stops once the cache is full,
+        as fetching more folders would only evict the ones already prefetched.
+
+        Args:
+            root (str): The absolute folder path to start from.
+            depth (int, optional): How many folder levels below the root to descend. Defaults to 1.
+                                   None descends until the cache is full.
+            max_workers (int): Number of concurrent listing requests. Defaults to 8.
+
+        Returns:
+            int: The number of folders whose listings were fetched or found in the cache.
+        """
+        return self._prefetch_tree(root, depth, max_workers, threading.Event())
+
+    def _prefetch_tree(self, root: str, depth: int, max_workers: int, stop: threading.Event) -> int:
+        """
+        Runs prefetch_tree, skipping the folders not yet listed once the stop event is set.
+        """
+        def get_listing(cache, fetch, folder_path):
+            if stop.is_set():
+                return None
+            return self._get_listing(cache, fetch, folder_path)
+
+        level = [root]
+        current_depth = 0
+        fetched = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level and fetched < _CACHE_MAX_ENTRIES and not stop.is_set():
+                level = level[:_CACHE_MAX_ENTRIES - fetched]
+                file_futures = [
+                    executor.submit(get_listing, self._file_cache, self._fetch_files, path) for path in level
+                ]
+                sub_folder_lists = list(executor.map(
+                    lambda path: get_listing(self._sub_cache, self._fetch_sub_folders, path), level
+                ))
+                for future in file_futures:
+                    future.result()
+                fetched += len(level)
+
+                if depth is not None and current_depth >= depth:
+                    break
+                level = [path for sub_folders in sub_folder_lists for path in sub_folders or []]
+                current_depth += 1
+
+        return fetched
 
     def get_mounted_volume_list(self) -> list:
         """
@@ -323,23 +1015,35 @@ class MediaStorage:
         Returns:
             list: A list of absolute folder paths (strings) corresponding to mounted volumes.
         """
-        return self.media_storage.GetMountedVolumeList()
+        return self._GetMountedVolumeList()
 
-    def get_sub_folder_list(self, folder_path: str) -> list:
+    def get_sub_folder_list(self, folder_path: str, lazy: bool = False) -> list:
         """
         Retrieves a list of folder paths in the given absolute folder path.
+        Results are cached for the configured TTL.
 
         Args:
             folder_path (str): The absolute path of the folder whose subfolders are to be listed.
+            lazy (bool): Whether to return the folders as LazyStorageEntry objects that list their
+                         own contents only when accessed. Defaults to False.
 
         Returns:
-            list: A list of absolute folder paths (strings) contained within the specified folder.
-        """
-        return self.media_storage.GetSubFolderList(folder_path)
+            list: A list of absolute folder paths (strings) contained within the specified folder,
+                  or a LazyStorageEntryList when lazy is True.
+        """
+        sub_folders = self._cache_get(self._sub_cache, folder_path)
+        if sub_folders is None:
+            sub_folders = self._fetch_sub_folders(folder_path)
+            if self._async_prefetch:
+                self._schedule_prefetch(folder_path, sub_folders)
+        if lazy:
+            return LazyStorageEntryList(self, sub_folders)
+        return _copy_listing(sub_folders)
 
     def get_file_list(self, folder_path: str) -> list:
         """
         Retrieves a list of media and file listings in the given absolute folder path.
+        Results are cached for the configured TTL.
 
         Args:
             folder_path (str): The absolute path of the folder whose files are to be listed.
@@ -348,7 +1052,57 @@ class MediaStorage:
             list: A list of media files (strings) contained within the specified folder.
                   Note: The media listings may include logically consolidated entries.
         """
-        return self.media_storage.GetFileList(folder_path)
+        return _copy_listing(self._get_listing(self._file_cache, self._fetch_files, folder_path))
+
+    def walk(self, root: str, topdown: bool = True, prefetch_depth: int = 0):
+        """
+        Walks the folder tree below root, listing each folder only when the walk reaches it,
+        in the manner of os.walk.
+
+        Args:
+            root (str): The absolute folder path to start from.
+            topdown (bool): Whether to yield a folder before its subfolders. When True, callers may
+                            remove entries from the yielded subfolder list to skip them. Defaults to True.
+            prefetch_depth (int): How many folder levels below root to prefetch in the background
+                                  while the walk proceeds. Defaults to 0 (no prefetch).
+
+        Yields:
+            tuple: A (folder_path, sub_folders, files) tuple for every folder in the tree.
+        """
+        stop = threading.Event()
+        future = None
+        if prefetch_depth:
+            future = self._get_executor().submit(self._prefetch_tree, root, prefetch_depth, 8, stop)
+        try:
+            yield from self._walk(root, topdown)
+        finally:
+            # Stop the background prefetch when the walk finishes or the generator is closed early.
+            stop.set()
+            if future is not None:
+                future.cancel()
+
+    def _walk(self, root: str, topdown: bool):
+        """
+        Yields the listings of the folder and of every folder below it, using an explicit stack
+        so deep trees do not hit the recursion limit.
+        """
+        # Entries are (folder_path, None) for folders still to be listed, or (folder_path, listing)
+        # for folders listed already whose bottom-up result is due once their subfolders are done.
+        stack = [(root, None)]
+        while stack:
+            folder_path, listing = stack.pop()
+            if listing is not None:
+                yield (folder_path,) + listing
+                continue
+
+            sub_folders = self.get_sub_folder_list(folder_path) or []
+            files = self.get_file_list(folder_path)
+            if topdown:
+                yield folder_path, sub_folders, files
+            else:
+                stack.append((folder_path, (sub_folders, files)))
+            # Pushed after the topdown yield so subfolders removed by the caller are skipped.
+            stack.extend((sub_folder, None) for sub_folder in reversed(sub_folders))
 
     def reveal_in_storage(self, path: str) -> bool:
         """
@@ -360,44 +1114,86 @@ class MediaStorage:
         Returns:
             bool: True if the file or folder is successfully revealed, False otherwise.
         """
-        return self.media_storage.RevealInStorage(path)
+        return self._RevealInStorage(path)
 
     def add_item_list_to_media_pool(self, *items) -> list:
         """
-        Adds the specified file or folder paths from Media Storage into the current Media Pool folder.
+        Adds the specified file or folder paths, or itemInfos, from Media Storage into the current Media Pool folder.
 
         Args:
-            *items: One or more file or folder paths to be added to the Media Pool.
+            *items: One or more file or folder paths or ItemInfo objects, or a single list of paths, ItemInfo
+                    objects or dictionaries with "media", "startFrame", and "endFrame" keys.
 
         Returns:
-            list: A list of MediaPoolItems created from the added file or folder paths.
+            list: A list of MediaPoolItems created from the added file or folder paths or itemInfos.
         """
-        return self.media_storage.AddItemListToMediaPool(*items)
+        self.invalidate()
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        elif not any(isinstance(info, ItemInfo) for info in items):
+            return self._AddItemListToMediaPool(*items)
 
-    def add_item_list_to_media_pool_array(self, items: list) -> list:
+        # ItemInfo objects are sent as itemInfo dictionaries in one list, the only form the API accepts them in.
+        if any(isinstance(info, ItemInfo) for info in items):
+            items = [
+                {"media": info.media, "startFrame": info.start_frame, "endFrame": info.end_frame}
+                if isinstance(info, ItemInfo) else info
+                for info in items
+            ]
+        return self._AddItemListToMediaPool(items)
+
+    def add_item_async(self, path: str) -> Future:
         """
-        Adds an array of file or folder paths from Media Storage into the current Media Pool folder.
+        Queues a file or folder path to be added to the current Media Pool folder. Paths queued
+        within a short window are added together with a single API call.
+        The order in which queued paths are added within one batch is not guaranteed.
 
         Args:
-            items (list): A list of file or folder paths to be added to the Media Pool.
+            path (str): The file or folder path to be added to the Media Pool.
 
         Returns:
-            list: A list of MediaPoolItems created from the added file or folder paths.
-        """
-        return self.media_storage.AddItemListToMediaPool(items)
-
-    def add_item_list_to_media_pool_info(self, item_info_list: list) -> list:
-        """
-        Adds a list of itemInfos from Media Storage into the current Media Pool folder. 
+            Future: Resolves to the list of MediaPoolItems created by the whole batch the path was added in,
+                    not only the items created from this path. The API does not report which item came from
+                    which path, so callers match their own by item.GetClipProperty('File Path').
+        """
+        future = Future()
+        with self._lock:
+            self._pending_adds.append((path, future))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_ADD_BATCH_WINDOW, self._flush_adds)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return future
+
+    def _flush_adds(self) -> None:
+        """
+        Adds every queued path to the Media Pool in one call and resolves the callers' futures.
+        """
+        with self._lock:
+            pending, self._pending_adds = self._pending_adds, []
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not pending:
+            return
+
+        self.invalidate()
+        try:
+            items = self._AddItemListToMediaPool([path for path, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
 
-        Args:
-            item_info_list (list): A list of dictionaries where each dictionary represents 
-                                   item information with "media", "startFrame", and "endFrame" keys.
+        for _, future in pending:
+            # Each caller gets its own list so one caller's changes are not seen by the others.
+            future.set_result(list(items) if items is not None else None)
 
-        Returns:
-            list: A list of MediaPoolItems created based on the specified itemInfos.
+    def flush(self) -> None:
         """
-        return self.media_storage.AddItemListToMediaPool(item_info_list)
+        Immediately adds every path queued by add_item_async to the Media Pool.
+        """
+        self._flush_adds()
 
     def add_clip_mattes_to_media_pool(self, media_pool_item, paths: list, stereo_eye: str = None) -> bool:
         """
@@ -412,7 +1208,8 @@ class MediaStorage:
         Returns:
             bool: True if the mattes are successfully added, False otherwise.
         """
-        return self.media_storage.AddClipMattesToMediaPool(media_pool_item, paths, stereo_eye)
+        self.invalidate()
+        return self._AddClipMattesToMediaPool(media_pool_item, paths, stereo_eye)
 
     def add_timeline_mattes_to_media_pool(self, paths: list) -> list:
         """
@@ -424,9 +1221,115 @@ class MediaStorage:
         Returns:
             list: A list of MediaPoolItems created as timeline mattes.
         """
-        return self.media_storage.AddTimelineMattesToMediaPool(paths)
+        return self._AddTimelineMattesToMediaPool(paths)
+
+class LazyStorageEntry:
+    __slots__ = ('_ms', 'path', '_files', '_subs')
+
+    def __init__(self, media_storage: MediaStorage, path: str):
+        """
+        Initializes a Media Storage folder entry whose listings are fetched on first access.
+
+        Args:
+            media_storage (MediaStorage): The media storage wrapper used to list the folder.
+            path (str): The absolute folder path of the entry.
+        """
+        self._ms = media_storage
+        self.path = path
+        self._files = None
+        self._subs = None
+
+    @property
+    def files(self) -> list:
+        """
+        list: The media and file listings of the folder, fetched on first access.
+        """
+        if self._files is None:
+            self._files = self._ms.get_file_list(self.path)
+        return self._files
+
+    @property
+    def subs(self) -> 'LazyStorageEntryList':
+        """
+        LazyStorageEntryList: The subfolders of the folder, fetched on first access.
+        """
+        if self._subs is None:
+            self._subs = self._ms.get_sub_folder_list(self.path, lazy=True)
+        return self._subs
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyStorageEntry):
+            return self.path == other.path
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, LazyStorageEntry):
+            return self.path < other.path
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyStorageEntry({self.path!r})"
+
+class LazyStorageEntryList(Sequence):
+    __slots__ = ('_entries',)
+
+    def __init__(self, media_storage: MediaStorage, paths: list):
+        """
+        Initializes a read-only sequence of LazyStorageEntry objects, one per folder path.
+        The folders are only listed when an entry's files or subs are accessed.
+
+        Args:
+            media_storage (MediaStorage): The media storage wrapper used to list the folders.
+            paths (list): The absolute folder paths (strings).
+        """
+        self._entries = [LazyStorageEntry(media_storage, path) for path in paths or []]
+
+    @classmethod
+    def _from_entries(cls, entries: list) -> 'LazyStorageEntryList':
+        """
+        Builds a LazyStorageEntryList sharing already created entries, e.g. for a slice.
+        """
+        lazy_list = cls.__new__(cls)
+        lazy_list._entries = entries
+        return lazy_list
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyStorageEntryList._from_entries(self._entries[index])
+        return self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __contains__(self, item) -> bool:
+        path = item.path if isinstance(item, LazyStorageEntry) else item
+        return any(entry.path == path for entry in self._entries)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyStorageEntryList):
+            return self._entries == other._entries
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyStorageEntryList({[entry.path for entry in self._entries]!r})"
 
 class ProjectManager:
+    __slots__ = (
+        'project_manager', '_neg', '_listing',
+        '_ArchiveProject', '_CreateProject', '_DeleteProject', '_LoadProject', '_GetCurrentProject',
+        '_SaveProject', '_CloseProject', '_CreateFolder', '_DeleteFolder', '_GetProjectListInCurrentFolder',
+        '_GetFolderListInCurrentFolder', '_GotoRootFolder', '_GotoParentFolder', '_GetCurrentFolder',
+        '_OpenFolder', '_ImportProject', '_ExportProject', '_RestoreProject', '_GetCurrentDatabase',
+        '_GetDatabaseList', '_SetCurrentDatabase', '_CreateCloudProject', '_ImportCloudProject',
+        '_RestoreCloudProject'
+    )
+
     def __init__(self, project_manager):
         """
         Initializes the ProjectManager class, wrapping the provided project manager object.
@@ -435,6 +1338,32 @@ class ProjectManager:
             project_manager: The underlying ProjectManager object from DaVinci Resolve's API.
         """
         self.project_manager = project_manager
+        self._neg = {}
+        self._listing = None
+        self._ArchiveProject = project_manager.ArchiveProject
+        self._CreateProject = project_manager.CreateProject
+        self._DeleteProject = project_manager.DeleteProject
+        self._LoadProject = project_manager.LoadProject
+        self._GetCurrentProject = project_manager.GetCurrentProject
+        self._SaveProject = project_manager.SaveProject
+        self._CloseProject = project_manager.CloseProject
+        self._CreateFolder = project_manager.CreateFolder
+        self._DeleteFolder = project_manager.DeleteFolder
+        self._GetProjectListInCurrentFolder = project_manager.GetProjectListInCurrentFolder
+        self._GetFolderListInCurrentFolder = project_manager.GetFolderListInCurrentFolder
+        self._GotoRootFolder = project_manager.GotoRootFolder
+        self._GotoParentFolder = project_manager.GotoParentFolder
+        self._GetCurrentFolder = project_manager.GetCurrentFolder
+        self._OpenFolder = project_manager.OpenFolder
+        self._ImportProject = project_manager.ImportProject
+        self._ExportProject = project_manager.ExportProject
+        self._RestoreProject = project_manager.RestoreProject
+        self._GetCurrentDatabase = project_manager.GetCurrentDatabase
+        self._GetDatabaseList = project_manager.GetDatabaseList
+        self._SetCurrentDatabase = project_manager.SetCurrentDatabase
+        self._CreateCloudProject = project_manager.CreateCloudProject
+        self._ImportCloudProject = project_manager.ImportCloudProject
+        self._RestoreCloudProject = project_manager.RestoreCloudProject
 
     def archive_project(
             self, project_name: str, file_path: str, is_archive_src_media: bool = True,
@@ -453,7 +1382,68 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully archived, False otherwise.
         """
-        return self.project_manager.ArchiveProject(project_name, file_path, is_archive_src_media, is_archive_render_cache, is_archive_proxy_media)
+        return self._ArchiveProject(project_name, file_path, is_archive_src_media, is_archive_render_cache, is_archive_proxy_media)
+
+    def archive_projects(
+            self, project_names: list, out_dir: str, is_archive_src_media: bool = True,
+            is_archive_render_cache: bool = True, is_archive_proxy_media: bool = False, max_workers: int = 4
+    ) -> dict:
+        """
+        Archives several projects concurrently, each to "<out_dir>/<project_name>.dra".
+        DaVinci Resolve may serialize heavy project I/O internally, so the speedup depends on max_workers.
+
+        Args:
+            project_names (list): The names of the projects to archive.
+            out_dir (str): The directory to save the archived projects in.
+            is_archive_src_media (bool): Whether to include source media in the archives. Defaults to True.
+            is_archive_render_cache (bool): Whether to include render cache in the archives. Defaults to True.
+            is_archive_proxy_media (bool): Whether to include proxy media in the archives. Defaults to False.
+            max_workers (int): Number of projects archived at the same time. Defaults to 4.
+
+        Returns:
+            dict: A mapping of project name to True if that project was successfully archived, False otherwise.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.archive_project, name, os.path.join(out_dir, f"{name}.dra"),
+                    is_archive_src_media, is_archive_render_cache, is_archive_proxy_media
+                ): name
+                for name in project_names
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
+
+    def _is_negative(self, key: tuple) -> bool:
+        """
+        Returns True if the lookup recently returned nothing and should not be repeated yet.
+        """
+        return self._neg.get(key, 0) > time.monotonic()
+
+    def _record_negative(self, key: tuple) -> None:
+        """
+        Remembers that the lookup returned nothing for the negative cache TTL.
+        """
+        self._neg[key] = time.monotonic() + _NEGATIVE_TTL
+
+    def _invalidate_lookups(self) -> None:
+        """
+        Forgets every cached "not found" answer and folder listing after the projects or current folder changed.
+        """
+        self._neg.clear()
+        self._listing = None
+
+    def list_current_folder(self) -> tuple:
+        """
+        Retrieves the project and folder names in the current folder, reusing the answer for a short time.
+
+        Returns:
+            tuple: A (projects, folders) tuple of the project names and folder names (strings) in the current folder.
+        """
+        listing = self._listing
+        if listing is None or time.monotonic() - listing[0] >= _LISTING_TTL:
+            listing = (time.monotonic(), self._GetProjectListInCurrentFolder(), self._GetFolderListInCurrentFolder())
+            self._listing = listing
+        return _copy_listing(listing[1]), _copy_listing(listing[2])
 
     def create_project(self, project_name: str):
         """
@@ -465,7 +1455,10 @@ class ProjectManager:
         Returns:
             Project: The newly created project, or None if a project with the same name already exists.
         """
-        return self.project_manager.CreateProject(project_name)
+        try:
+            return self._CreateProject(project_name)
+        finally:
+            self._invalidate_lookups()
 
     def delete_project(self, project_name: str) -> bool:
         """
@@ -477,11 +1470,15 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully deleted, False otherwise.
         """
-        return self.project_manager.DeleteProject(project_name)
+        try:
+            return self._DeleteProject(project_name)
+        finally:
+            self._invalidate_lookups()
 
     def load_project(self, project_name: str):
         """
         Loads and returns the project with the specified name.
+        A name that was not found is not looked up again for a short time.
 
         Args:
             project_name (str): The name of the project to load.
@@ -489,7 +1486,14 @@ class ProjectManager:
         Returns:
             Project: The loaded project, or None if no matching project is found.
         """
-        return self.project_manager.LoadProject(project_name)
+        key = ('load_project', project_name)
+        if self._is_negative(key):
+            return None
+
+        project = self._LoadProject(project_name)
+        if project is None:
+            self._record_negative(key)
+        return project
 
     def get_current_project(self):
         """
@@ -498,7 +1502,7 @@ class ProjectManager:
         Returns:
             Project: The currently loaded project.
         """
-        return self.project_manager.GetCurrentProject()
+        return self._GetCurrentProject()
 
     def save_project(self) -> bool:
         """
@@ -507,7 +1511,7 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully saved, False otherwise.
         """
-        return self.project_manager.SaveProject()
+        return self._SaveProject()
 
     def close_project(self, project) -> bool:
         """
@@ -519,7 +1523,7 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully closed, False otherwise.
         """
-        return self.project_manager.CloseProject(project)
+        return self._CloseProject(project)
 
     def create_folder(self, folder_name: str) -> bool:
         """
@@ -531,7 +1535,10 @@ class ProjectManager:
         Returns:
             bool: True if the folder was successfully created, False otherwise.
         """
-        return self.project_manager.CreateFolder(folder_name)
+        try:
+            return self._CreateFolder(folder_name)
+        finally:
+            self._invalidate_lookups()
 
     def delete_folder(self, folder_name: str) -> bool:
         """
@@ -543,7 +1550,10 @@ class ProjectManager:
         Returns:
             bool: True if the folder was successfully deleted, False otherwise.
         """
-        return self.project_manager.DeleteFolder(folder_name)
+        try:
+            return self._DeleteFolder(folder_name)
+        finally:
+            self._invalidate_lookups()
 
     def get_project_list_in_current_folder(self) -> list:
         """
@@ -552,7 +1562,7 @@ class ProjectManager:
         Returns:
             list: A list of project names (strings) in the current folder.
         """
-        return self.project_manager.GetProjectListInCurrentFolder()
+        return self._GetProjectListInCurrentFolder()
 
     def get_folder_list_in_current_folder(self) -> list:
         """
@@ -561,7 +1571,7 @@ class ProjectManager:
         Returns:
             list: A list of folder names (strings) in the current folder.
         """
-        return self.project_manager.GetFolderListInCurrentFolder()
+        return self._GetFolderListInCurrentFolder()
 
     def goto_root_folder(self) -> bool:
         """
@@ -570,7 +1580,10 @@ class ProjectManager:
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self.project_manager.GotoRootFolder()
+        try:
+            return self._GotoRootFolder()
+        finally:
+            self._invalidate_lookups()
 
     def goto_parent_folder(self) -> bool:
         """
@@ -579,16 +1592,27 @@ class ProjectManager:
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self.project_manager.GotoParentFolder()
+        try:
+            return self._GotoParentFolder()
+        finally:
+            self._invalidate_lookups()
 
     def get_current_folder(self) -> str | None:
         """
         Returns the name of the current folder, or None if the folder is not set.
+        An unset folder is not looked up again for a short time.
 
         Returns:
             str or none: The name of the current folder, or None if no folder is set.
         """
-        return self.project_manager.GetCurrentFolder() or None
+        key = ('get_current_folder',)
+        if self._is_negative(key):
+            return None
+
+        folder = self._GetCurrentFolder() or None
+        if folder is None:
+            self._record_negative(key)
+        return folder
 
     def open_folder(self, folder_name: str) -> bool:
         """
@@ -600,7 +1624,10 @@ class ProjectManager:
         Returns:
             bool: True if the folder was successfully opened, False otherwise.
         """
-        return self.project_manager.OpenFolder(folder_name)
+        try:
+            return self._OpenFolder(folder_name)
+        finally:
+            self._invalidate_lookups()
 
     def import_project(self, file_path: str, project_name: str = None) -> bool:
         """
@@ -613,7 +1640,10 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully imported, False otherwise.
         """
-        return self.project_manager.ImportProject(file_path, project_name)
+        try:
+            return self._ImportProject(file_path, project_name)
+        finally:
+            self._invalidate_lookups()
 
     def export_project(self, project_name: str, file_path: str, with_stills_and_luts: bool = True) -> bool:
         """
@@ -627,7 +1657,32 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully exported, False otherwise.
         """
-        return self.project_manager.ExportProject(project_name, file_path, with_stills_and_luts)
+        return self._ExportProject(project_name, file_path, with_stills_and_luts)
+
+    def export_projects(
+            self, project_names: list, out_dir: str, with_stills_and_luts: bool = True, max_workers: int = 4
+    ) -> dict:
+        """
+        Exports several projects concurrently, each to "<out_dir>/<project_name>.drp".
+        DaVinci Resolve may serialize heavy project I/O internally, so the speedup depends on max_workers.
+
+        Args:
+            project_names (list): The names of the projects to export.
+            out_dir (str): The directory to save the exported projects in.
+            with_stills_and_luts (bool): Whether to include stills and LUTs in the exports. Defaults to True.
+            max_workers (int): Number of projects exported at the same time. Defaults to 4.
+
+        Returns:
+            dict: A mapping of project name to True if that project was successfully exported, False otherwise.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.export_project, name, os.path.join(out_dir, f"{name}.drp"), with_stills_and_luts
+                ): name
+                for name in project_names
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
 
     def restore_project(self, file_path: str, project_name: str = None) -> bool:
         """
@@ -640,7 +1695,10 @@ class ProjectManager:
         Returns:
             bool: True if the project was successfully restored, False otherwise.
         """
-        return self.project_manager.RestoreProject(file_path, project_name)
+        try:
+            return self._RestoreProject(file_path, project_name)
+        finally:
+            self._invalidate_lookups()
 
     def get_current_database(self) -> dict:
         """
@@ -650,7 +1708,7 @@ class ProjectManager:
             dict: A dictionary containing information about the current database with keys 
                   'DbType', 'DbName', and optionally 'IpAddress'.
         """
-        return self.project_manager.GetCurrentDatabase()
+        return self._GetCurrentDatabase()
 
     def get_database_list(self) -> list:
         """
@@ -659,7 +1717,7 @@ class ProjectManager:
         Returns:
             list: A list of dictionaries, each containing database information.
         """
-        return self.project_manager.GetDatabaseList()
+        return self._GetDatabaseList()
 
     def set_current_database(self, db_info: dict) -> bool:
         """
@@ -671,7 +1729,10 @@ class ProjectManager:
         Returns:
             bool: True if the database connection was successfully switched, False otherwise.
         """
-        return self.project_manager.SetCurrentDatabase(db_info)
+        try:
+            return self._SetCurrentDatabase(db_info)
+        finally:
+            self._invalidate_lookups()
 
     def create_cloud_project(self, cloud_settings: dict):
         """
@@ -683,7 +1744,10 @@ class ProjectManager:
         Returns:
             Project: The newly created cloud project.
         """
-        return self.project_manager.CreateCloudProject(cloud_settings)
+        try:
+            return self._CreateCloudProject(cloud_settings)
+        finally:
+            self._invalidate_lookups()
 
     def import_cloud_project(self, file_path: str, cloud_settings: dict) -> bool:
         """
@@ -696,7 +1760,10 @@ class ProjectManager:
         Returns:
             bool: True if the cloud project was successfully imported, False otherwise.
         """
-        return self.project_manager.ImportCloudProject(file_path, cloud_settings)
+        try:
+            return self._ImportCloudProject(file_path, cloud_settings)
+        finally:
+            self._invalidate_lookups()
 
     def restore_cloud_project(self, folder_path: str, cloud_settings: dict) -> bool:
         """
@@ -709,6 +1776,9 @@ class ProjectManager:
         Returns:
             bool: True if the cloud project was successfully restored, False otherwise.
         """
-        return self.project_manager.RestoreCloudProject(folder_path, cloud_settings)
+        try:
+            return self._RestoreCloudProject(folder_path, cloud_settings)
+        finally:
+            self._invalidate_lookups()
 
 
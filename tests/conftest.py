@@ -0,0 +1,20 @@
+import sys
+import types
+
+import pytest
+
+try:
+    from blackmagic_design.Resolve import Resolve
+except ImportError:
+    # DaVinci Resolve is not installed; stub its scripting module so the wrappers can be tested with fakes.
+    fusionscript = types.ModuleType('fusionscript')
+    fusionscript.scriptapp = lambda app: None
+    sys.modules['fusionscript'] = fusionscript
+    from blackmagic_design.Resolve import Resolve
+
+
+@pytest.fixture(scope="session")
+def resolve():
+    r = Resolve()
+    yield r
+    r.kill()
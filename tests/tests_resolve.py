@@ -1,18 +1,26 @@
+import ast
+import inspect
+
 from blackmagic_design.Resolve import Resolve
 
 
-def test_initialize_resolve_nogui_success():
-    assert Resolve().open(gui='-nogui') == 'DaVinci Resolve opened successfully.'
-    Resolve().kill()
+def test_initialize_resolve_nogui_success(resolve):
+    assert resolve.open(gui='-nogui') == 'DaVinci Resolve opened successfully.'
+    resolve.kill()
 
-def test_initialize_resolve_success():
-    assert Resolve().open() == 'DaVinci Resolve opened successfully.'
+def test_initialize_resolve_success(resolve):
+    assert resolve.open() == 'DaVinci Resolve opened successfully.'
 
-def test_resolve_already_running():
-    assert Resolve().open() == 'DaVinci Resolve is already running.'
-    Resolve().kill()
+def test_resolve_already_running(resolve):
+    assert resolve.open() == 'DaVinci Resolve is already running.'
+    resolve.kill()
 
-def test_initialize_wrong_executable_path():
+def test_initialize_wrong_executable_path(resolve):
     executable_path = 'D:/wrong/path/Resolve.exe'
-    assert Resolve().open(executable_path=executable_path) == f"Error: Resolve executable not found at '{executable_path}'. Please check the path and try again."
+    assert resolve.open(executable_path=executable_path) == f"Error: Resolve executable not found at '{executable_path}'. Please check the path and try again."
 
+def test_resolve_module_defines_each_class_once():
+    tree = ast.parse(inspect.getsource(inspect.getmodule(Resolve)))
+    class_names = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    assert class_names.count('MediaStorage') == 1
+    assert len(class_names) == len(set(class_names))
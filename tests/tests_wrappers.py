@@ -0,0 +1,559 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import blackmagic_design.Resolve as resolve_module
+from blackmagic_design.Resolve import (
+    ItemInfo, LazyStorageEntry, LazyStorageEntryList, MediaStorage, ProjectManager, Resolve
+)
+
+class FakeMediaStorage:
+    def __init__(self, tree=None, volumes=('/v',), gate=None, gated=None):
+        self.tree = tree if tree is not None else {'/v': ['/v/a', '/v/b'], '/v/a': ['/v/a/c']}
+        self.volumes = list(volumes)
+        self.gate = gate
+        self.gated = gated
+        self.started = threading.Event()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def count(self, name, path=None):
+        return sum(1 for call in self.calls if call[0] == name and (path is None or call[1] == path))
+
+    def _wait(self, path):
+        if self.gate is not None and (self.gated is None or path in self.gated):
+            self.started.set()
+            self.gate.wait(5)
+
+    def GetMountedVolumeList(self):
+        return list(self.volumes)
+
+    def GetSubFolderList(self, path):
+        with self.lock:
+            self.calls.append(('GetSubFolderList', path))
+        self._wait(path)
+        return list(self.tree.get(path, []))
+
+    def GetFileList(self, path):
+        with self.lock:
+            self.calls.append(('GetFileList', path))
+        self._wait(path)
+        return [f'{path}/clip.mov']
+
+    def RevealInStorage(self, path):
+        return True
+
+    def AddItemListToMediaPool(self, *items):
+        self.calls.append(('AddItemListToMediaPool', items))
+        items = items[0] if len(items) == 1 and isinstance(items[0], list) else list(items)
+        return [f'item:{item}' for item in items]
+
+    def AddClipMattesToMediaPool(self, media_pool_item, paths, stereo_eye=None):
+        return True
+
+    def AddTimelineMattesToMediaPool(self, paths):
+        return []
+
+
+class FakeProjectManager:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.results = {'GetCurrentFolder': ''}
+
+    def count(self, name):
+        return sum(1 for call in self.calls if call[0] == name)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def call(*args):
+            with self.lock:
+                self.calls.append((name, args))
+            if args[:1] == ('missing',):
+                return None if name == 'LoadProject' else False
+            return self.results.get(name, True)
+        return call
+
+
+class FakeApp:
+    def __init__(self):
+        self.media_storage = FakeMediaStorage()
+        self.project_manager = FakeProjectManager()
+        self.page = 'edit'
+        self.calls = []
+
+    def count(self, name):
+        return self.calls.count(name)
+
+    def GetMediaStorage(self):
+        return self.media_storage
+
+    def GetProjectManager(self):
+        return self.project_manager
+
+    def GetProductName(self):
+        self.calls.append('GetProductName')
+        return 'DaVinci Resolve'
+
+    def GetVersion(self):
+        self.calls.append('GetVersion')
+        return [19, 0, 0, 0, '']
+
+    def OpenPage(self, page):
+        self.page = page
+        return True
+
+    def GetCurrentPage(self):
+        self.calls.append('GetCurrentPage')
+        return self.page
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(resolve_module.time, 'monotonic', fake_clock)
+    return fake_clock
+
+
+class DiskTree(dict):
+    def __init__(self, root):
+        self.root = str(root)
+        self.a = str(root / 'a')
+        self.b = str(root / 'b')
+        super().__init__({self.root: [self.a, self.b], self.a: []})
+        for path in (self.a, self.b):
+            os.makedirs(path)
+
+
+@pytest.fixture
+def disk(tmp_path):
+    return DiskTree(tmp_path / 'v')
+
+
+@pytest.fixture
+def app(monkeypatch):
+    fake_app = FakeApp()
+    monkeypatch.setattr(resolve_module, '_scriptapp', lambda name: fake_app)
+    return fake_app
+
+
+def test_listing_is_cached_until_ttl_expires(clock):
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake, cache_ttl=10)
+    assert ms.get_sub_folder_list('/v') == ['/v/a', '/v/b']
+    ms.get_sub_folder_list('/v')
+    assert fake.count('GetSubFolderList', '/v') == 1
+    clock.now += 10
+    ms.get_sub_folder_list('/v')
+    assert fake.count('GetSubFolderList', '/v') == 2
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(resolve_module, '_CACHE_MAX_ENTRIES', 2)
+    ms = MediaStorage(FakeMediaStorage())
+    ms.get_file_list('/1')
+    ms.get_file_list('/2')
+    ms.get_file_list('/1')
+    ms.get_file_list('/3')
+    assert list(ms._file_cache) == ['/1', '/3']
+
+def test_invalidate_drops_one_or_all_paths():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    ms.get_file_list('/v')
+    ms.get_file_list('/v/a')
+    ms.invalidate('/v')
+    ms.get_file_list('/v')
+    ms.get_file_list('/v/a')
+    assert fake.count('GetFileList', '/v') == 2
+    assert fake.count('GetFileList', '/v/a') == 1
+    ms.invalidate()
+    ms.get_file_list('/v/a')
+    assert fake.count('GetFileList', '/v/a') == 2
+
+def test_prefetch_tree_fills_cache_level_by_level():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    assert ms.prefetch_tree('/v', depth=1) == 3
+    assert fake.count('GetSubFolderList', '/v/a/c') == 0
+    calls = len(fake.calls)
+    ms.get_sub_folder_list('/v/a')
+    ms.get_file_list('/v/b')
+    assert len(fake.calls) == calls
+
+def test_async_prefetch_lists_children_of_missed_folder():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake, async_prefetch=True)
+    assert ms.get_sub_folder_list('/v') == ['/v/a', '/v/b']
+    ms._executor.shutdown(wait=True)
+    assert fake.count('GetSubFolderList', '/v/a') == 1
+    assert fake.count('GetFileList', '/v/b') == 1
+    calls = len(fake.calls)
+    ms.get_sub_folder_list('/v/a')
+    ms.get_file_list('/v')
+    assert len(fake.calls) == calls
+
+def test_without_async_prefetch_only_requested_folder_is_listed():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    ms.get_sub_folder_list('/v')
+    assert fake.calls == [('GetSubFolderList', '/v')]
+
+def test_add_item_async_batches_paths(monkeypatch):
+    monkeypatch.setattr(resolve_module, '_ADD_BATCH_WINDOW', 60)
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    first = ms.add_item_async('/v/1.mov')
+    second = ms.add_item_async('/v/2.mov')
+    ms.flush()
+    assert fake.count('AddItemListToMediaPool') == 1
+    assert sorted(first.result()) == ['item:/v/1.mov', 'item:/v/2.mov']
+    assert first.result() == second.result()
+    assert first.result() is not second.result()
+
+def test_lazy_entries_list_their_contents_on_access():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    entries = ms.get_sub_folder_list('/v', lazy=True)
+    assert fake.count('GetSubFolderList', '/v/a') == 0
+    assert [entry.path for entry in entries] == ['/v/a', '/v/b']
+    assert [entry.path for entry in entries[0].subs] == ['/v/a/c']
+    assert entries[0].files == ['/v/a/clip.mov']
+    assert fake.count('GetSubFolderList', '/v/a') == 1
+
+def test_scriptapp_handles_are_memoized_until_cleared(monkeypatch):
+    attaches = []
+
+    def scriptapp(app):
+        attaches.append(app)
+        return None if app == 'Missing' else object()
+    monkeypatch.setattr(resolve_module.bmd, 'scriptapp', scriptapp)
+    monkeypatch.setattr(resolve_module, '_APP_CACHE', {})
+    handle = resolve_module._scriptapp('Resolve')
+    assert resolve_module._scriptapp('Resolve') is handle
+    assert resolve_module._scriptapp('Missing') is None
+    assert resolve_module._scriptapp('Missing') is None
+    assert attaches == ['Resolve', 'Missing', 'Missing']
+    Resolve.clear_app_cache()
+    assert resolve_module._scriptapp('Resolve') is not handle
+    assert attaches.count('Resolve') == 2
+
+def test_export_projects_exports_each_project_to_out_dir():
+    fake = FakeProjectManager()
+    pm = ProjectManager(fake)
+    results = pm.export_projects(['A', 'missing'], '/out', with_stills_and_luts=False)
+    assert results == {'A': True, 'missing': False}
+    assert sorted(args for name, args in fake.calls if name == 'ExportProject') == [
+        ('A', os.path.join('/out', 'A.drp'), False), ('missing', os.path.join('/out', 'missing.drp'), False)
+    ]
+
+def test_archive_projects_archives_each_project_to_out_dir():
+    fake = FakeProjectManager()
+    pm = ProjectManager(fake)
+    assert pm.archive_projects(['A', 'B'], '/out') == {'A': True, 'B': True}
+    assert sorted(args for name, args in fake.calls if name == 'ArchiveProject') == [
+        ('A', os.path.join('/out', 'A.dra'), True, True, False), ('B', os.path.join('/out', 'B.dra'), True, True, False)
+    ]
+
+def test_negative_lookups_are_cached_until_a_change(clock):
+    fake = FakeProjectManager()
+    pm = ProjectManager(fake)
+    assert pm.load_project('missing') is None
+    assert pm.load_project('missing') is None
+    assert pm.get_current_folder() is None
+    assert pm.get_current_folder() is None
+    assert fake.count('LoadProject') == 1
+    assert fake.count('GetCurrentFolder') == 1
+    pm.create_project('missing')
+    pm.load_project('missing')
+    assert fake.count('LoadProject') == 2
+    clock.now += resolve_module._NEGATIVE_TTL
+    pm.get_current_folder()
+    assert fake.count('GetCurrentFolder') == 2
+
+def test_add_item_list_passes_paths_as_one_list():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    ms.add_item_list_to_media_pool(('/v/1.mov', '/v/2.mov'))
+    ms.add_item_list_to_media_pool('/v/3.mov')
+    assert [call[1] for call in fake.calls] == [(('/v/1.mov', '/v/2.mov'),), ('/v/3.mov',)]
+
+def test_saved_cache_is_loaded_for_mounted_volumes(tmp_path, disk):
+    cache_file = str(tmp_path / 'cache' / 'storage.json')
+    ms = MediaStorage(FakeMediaStorage(disk, volumes=[disk.root]))
+    ms.get_sub_folder_list(disk.root)
+    ms.get_file_list('/w')
+    ms.save_cache(cache_file)
+
+    fake = FakeMediaStorage(disk, volumes=[disk.root])
+    loaded = MediaStorage(fake)
+    assert loaded.load_cache(cache_file) == 1
+    assert loaded.get_sub_folder_list(disk.root) == disk[disk.root]
+    assert fake.count('GetSubFolderList') == 0
+    loaded.get_file_list('/w')
+    assert fake.count('GetFileList', '/w') == 1
+
+def test_load_cache_ignores_missing_file(tmp_path):
+    assert MediaStorage(FakeMediaStorage()).load_cache(str(tmp_path / 'missing.json')) == 0
+
+def test_walk_yields_every_folder_once():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    walked = [folder for folder, _, _ in ms.walk('/v')]
+    assert walked == ['/v', '/v/a', '/v/a/c', '/v/b']
+    assert all(fake.count('GetSubFolderList', path) == 1 for path in walked)
+    bottom_up = [folder for folder, _, _ in ms.walk('/v', topdown=False)]
+    assert bottom_up == ['/v/a/c', '/v/a', '/v/b', '/v']
+
+def test_walk_skips_subfolders_removed_by_caller():
+    ms = MediaStorage(FakeMediaStorage())
+    walked = []
+    for folder, sub_folders, files in ms.walk('/v'):
+        walked.append(folder)
+        if '/v/a' in sub_folders:
+            sub_folders.remove('/v/a')
+    assert walked == ['/v', '/v/b']
+
+def test_add_item_list_converts_item_info():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    ms.add_item_list_to_media_pool([ItemInfo('/v/clip.mov', 1, 10), '/v/other.mov'])
+    assert fake.calls[-1] == (
+        'AddItemListToMediaPool', ([{'media': '/v/clip.mov', 'startFrame': 1, 'endFrame': 10}, '/v/other.mov'],)
+    )
+    ms.add_item_list_to_media_pool(ItemInfo('/v/clip.mov', 1, 10), ItemInfo('/v/other.mov', 5, 6))
+    assert fake.calls[-1] == ('AddItemListToMediaPool', ([
+        {'media': '/v/clip.mov', 'startFrame': 1, 'endFrame': 10}, {'media': '/v/other.mov', 'startFrame': 5, 'endFrame': 6}
+    ],))
+
+def test_product_name_and_version_are_queried_once(app):
+    r = Resolve()
+    assert r.get_product_name() == r.product_name == 'DaVinci Resolve'
+    assert r.get_version() == r.version == [19, 0, 0, 0, '']
+    assert app.count('GetProductName') == 1
+    assert app.count('GetVersion') == 1
+
+def test_list_current_folder_is_cached_until_a_change(clock):
+    fake = FakeProjectManager()
+    fake.results.update(GetProjectListInCurrentFolder=['A'], GetFolderListInCurrentFolder=['F'])
+    pm = ProjectManager(fake)
+    assert pm.list_current_folder() == (['A'], ['F'])
+    assert pm.list_current_folder() == (['A'], ['F'])
+    assert fake.count('GetProjectListInCurrentFolder') == 1
+    pm.create_folder('G')
+    pm.list_current_folder()
+    assert fake.count('GetProjectListInCurrentFolder') == 2
+    clock.now += resolve_module._LISTING_TTL
+    pm.list_current_folder()
+    assert fake.count('GetFolderListInCurrentFolder') == 3
+
+def test_batch_returns_results_in_order(app):
+    r = Resolve()
+    assert r.batch([lambda: 1, r.get_current_page, lambda: 3]) == [1, 'edit', 3]
+
+def test_current_page_is_reused_briefly(app, clock):
+    r = Resolve()
+    assert r.get_current_page() == 'edit'
+    assert r.get_current_page() == 'edit'
+    assert app.count('GetCurrentPage') == 1
+    assert r.open_page('Color')
+    assert r.get_current_page() == 'color'
+    assert app.count('GetCurrentPage') == 1
+    clock.now += resolve_module._PAGE_TTL
+    r.get_current_page()
+    assert app.count('GetCurrentPage') == 2
+    with pytest.raises(ValueError):
+        r.open_page('timeline')
+
+def test_returned_listing_does_not_alias_cache():
+    ms = MediaStorage(FakeMediaStorage())
+    ms.get_sub_folder_list('/v').append('/v/z')
+    ms.get_file_list('/v').clear()
+    assert ms.get_sub_folder_list('/v') == ['/v/a', '/v/b']
+    assert ms.get_file_list('/v') == ['/v/clip.mov']
+
+def test_list_current_folder_returns_copies():
+    fake = FakeProjectManager()
+    fake.results.update(GetProjectListInCurrentFolder=['A'], GetFolderListInCurrentFolder=['F'])
+    pm = ProjectManager(fake)
+    projects, folders = pm.list_current_folder()
+    projects.append('B')
+    folders.clear()
+    assert pm.list_current_folder() == (['A'], ['F'])
+    assert fake.count('GetProjectListInCurrentFolder') == 1
+
+def test_reset_drops_wrappers(app):
+    r = Resolve()
+    media_storage = r.media_storage
+    project_manager = r.project_manager
+    r._reset_app_state()
+    assert r.media_storage is not media_storage
+    assert r.project_manager is not project_manager
+
+def test_concurrent_fetches_of_a_listing_share_one_call():
+    gate = threading.Event()
+    fake = FakeMediaStorage(gate=gate)
+    ms = MediaStorage(fake)
+    threads = [threading.Thread(target=ms.get_file_list, args=('/v',)) for _ in range(4)]
+    threads[0].start()
+    assert fake.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join()
+    assert fake.count('GetFileList', '/v') == 1
+
+def test_prefetch_tree_descends_one_level_by_default():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    assert ms.prefetch_tree('/v') == 3
+    assert fake.count('GetSubFolderList', '/v/a/c') == 0
+    assert ms.prefetch_tree('/v', depth=None) >= 1
+    assert fake.count('GetSubFolderList', '/v/a/c') == 1
+
+def test_prefetch_tree_stops_at_cache_capacity(monkeypatch):
+    monkeypatch.setattr(resolve_module, '_CACHE_MAX_ENTRIES', 2)
+    ms = MediaStorage(FakeMediaStorage())
+    assert ms.prefetch_tree('/v', depth=None) == 2
+
+def test_resolve_prefetch_tree_without_app_returns_zero(monkeypatch):
+    monkeypatch.setattr(resolve_module, '_scriptapp', lambda name: None)
+    assert Resolve().prefetch_tree() == 0
+
+def test_prefetch_tree_skips_cached_folders():
+    fake = FakeMediaStorage()
+    ms = MediaStorage(fake)
+    ms.get_sub_folder_list('/v')
+    assert ms.prefetch_tree('/v') == 3
+    assert fake.count('GetSubFolderList', '/v') == 1
+
+def test_closing_walk_stops_prefetch():
+    gate = threading.Event()
+    tree = {'/v': ['/v/a'], '/v/a': ['/v/a/b'], '/v/a/b': ['/v/a/b/c']}
+    fake = FakeMediaStorage(tree, gate=gate, gated={'/v/a'})
+    ms = MediaStorage(fake)
+    executor = ms._get_executor()
+    walk = ms.walk('/v', prefetch_depth=3)
+    assert next(walk)[0] == '/v'
+    assert fake.started.wait(5)
+    walk.close()
+    gate.set()
+    executor.shutdown(wait=True)
+    assert fake.count('GetSubFolderList', '/v/a/b') == 0
+
+def test_load_cache_skips_old_and_modified_folders(tmp_path, disk):
+    cache_file = str(tmp_path / 'cache' / 'storage.json')
+    ms = MediaStorage(FakeMediaStorage(disk, volumes=[disk.root]), cache_ttl=0)
+    ms.get_sub_folder_list(disk.root)
+    ms.get_sub_folder_list(disk.a)
+    ms.get_file_list(disk.b)
+    ms.save_cache(cache_file)
+    with open(cache_file, encoding='utf-8') as f:
+        data = json.load(f)
+    assert set(data['sub_folders']) == {disk.root, disk.a}
+    data['files'][disk.b][0] = time.time() - 100
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    stat = os.stat(disk.a)
+    os.utime(disk.a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    fake = FakeMediaStorage(disk, volumes=[disk.root])
+    loaded = MediaStorage(fake)
+    assert loaded.load_cache(cache_file, max_age=50) == 1
+    assert loaded.get_sub_folder_list(disk.root) == disk[disk.root]
+    assert fake.count('GetSubFolderList', disk.root) == 0
+    loaded.get_sub_folder_list(disk.a)
+    assert fake.count('GetSubFolderList', disk.a) == 1
+    assert list(tmp_path.joinpath('cache').iterdir()) == [tmp_path / 'cache' / 'storage.json']
+
+def test_loaded_listing_expires_after_cache_ttl(tmp_path, disk, clock):
+    cache_file = str(tmp_path / 'cache' / 'storage.json')
+    ms = MediaStorage(FakeMediaStorage(disk, volumes=[disk.root]))
+    ms.get_sub_folder_list(disk.root)
+    ms.save_cache(cache_file)
+
+    fake = FakeMediaStorage(disk, volumes=[disk.root])
+    loaded = MediaStorage(fake, cache_ttl=10)
+    assert loaded.load_cache(cache_file) == 1
+    clock.now += 10
+    loaded.get_sub_folder_list(disk.root)
+    assert fake.count('GetSubFolderList', disk.root) == 1
+
+def test_lazy_entry_list_behaves_as_sequence():
+    ms = MediaStorage(FakeMediaStorage())
+    entries = ms.get_sub_folder_list('/v', lazy=True)
+    assert len(entries) == 2
+    assert '/v/a' in entries and LazyStorageEntry(ms, '/v/b') in entries
+    assert isinstance(entries[:1], LazyStorageEntryList)
+    assert all(isinstance(entry, LazyStorageEntry) for entry in reversed(entries))
+    assert [entry.path for entry in sorted(entries, reverse=True)] == ['/v/b', '/v/a']
+    assert repr(entries) == "LazyStorageEntryList(['/v/a', '/v/b'])"
+
+def test_cloud_project_calls_invalidate_lookups(clock):
+    fake = FakeProjectManager()
+    pm = ProjectManager(fake)
+    assert pm.load_project('missing') is None
+    pm.create_cloud_project({})
+    assert pm.load_project('missing') is None
+    assert fake.count('LoadProject') == 2
+
+def test_missing_executable_is_checked_again(tmp_path):
+    executable = tmp_path / 'Resolve.exe'
+    assert not resolve_module._executable_exists(str(executable))
+    executable.touch()
+    assert resolve_module._executable_exists(str(executable))
+
+def test_init_error_is_exposed(monkeypatch):
+    def fail(name):
+        raise RuntimeError('no scripting')
+    monkeypatch.setattr(resolve_module, '_scriptapp', fail)
+    r = Resolve()
+    assert r.app is None
+    assert str(r.init_error) == 'no scripting'
+
+def test_closing_walk_skips_queued_listings_of_a_level():
+    gate = threading.Event()
+    children = [f'/v/{index}' for index in range(50)]
+    fake = FakeMediaStorage({'/v': children}, gate=gate, gated=set(children))
+    ms = MediaStorage(fake)
+    executor = ms._get_executor()
+    walk = ms.walk('/v', prefetch_depth=1)
+    assert next(walk)[0] == '/v'
+    assert fake.started.wait(5)
+    walk.close()
+    gate.set()
+    executor.shutdown(wait=True)
+    assert sum(1 for call in fake.calls if call[1] in children) <= 8
+
+def test_open_drops_handle_of_resolve_closed_elsewhere(monkeypatch):
+    stale, fresh = object(), FakeApp()
+    running = iter([False, True])
+    monkeypatch.setattr(resolve_module, '_APP_CACHE', {'Resolve': stale})
+    monkeypatch.setattr(resolve_module.bmd, 'scriptapp', lambda app: fresh)
+    monkeypatch.setattr(resolve_module, '_executable_exists', lambda path: True)
+    monkeypatch.setattr(resolve_module, '_resolve_is_running', lambda: next(running))
+    monkeypatch.setattr(resolve_module.subprocess, 'Popen', lambda *args, **kwargs: None)
+    r = Resolve()
+    assert r.app is stale
+    assert r.open() == "DaVinci Resolve opened successfully."
+    assert r.app is fresh
+
+def test_walk_handles_trees_deeper_than_the_recursion_limit():
+    folders = ['/v'] + [f'/v/{depth}' for depth in range(1, 1500)]
+    tree = {parent: [child] for parent, child in zip(folders, folders[1:])}
+    ms = MediaStorage(FakeMediaStorage(tree))
+    assert [folder for folder, _, _ in ms.walk('/v')] == folders
+    assert [folder for folder, _, _ in ms.walk('/v', topdown=False)] == folders[::-1]